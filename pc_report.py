@@ -1,43 +1,114 @@
 import psutil
-import wmi
 import platform
+import ctypes
 import os
+import io
+import itertools
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 
-# Initialize WMI
-wmi_instance = wmi.WMI()
+# COM (pywin32) and ReportLab are imported on first use, so callers that only
+# want some of the getters don't pay for them at import time
+
+_GIB = 1 << 30
+
+def _gb(n):
+    """Format a byte count in gigabytes"""
+    return f"{n / _GIB:.2f} GB"
+
+# Prime the CPU usage counter so later reads don't have to block sampling
+psutil.cpu_percent(interval=None)
+
+# WMI connections are bound to the COM apartment of the thread that made
+# them, so the connection is kept per thread and created on first use
+_wmi_local = threading.local()
+
+# wbemFlagReturnImmediately | wbemFlagForwardOnly: results are read once,
+# so WMI doesn't need to keep a rewindable copy of them
+_WBEM_QUERY_FLAGS = 0x10 | 0x20
+
+def _wmi():
+    """Return this thread's WMI service connection, connecting on first call"""
+    conn = getattr(_wmi_local, 'conn', None)
+    if conn is None:
+        import win32com.client
+        locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+        conn = _wmi_local.conn = locator.ConnectServer(".", "root\\cimv2")
+    return conn
+
+def _run_wmi_getters(*getters):
+    """Run WMI-backed getters in order on this thread, sharing one connection"""
+    import pythoncom
+    pythoncom.CoInitialize()
+    try:
+        return [getter() for getter in getters]
+    finally:
+        # Release the connection before COM is torn down for this thread
+        _wmi_local.conn = None
+        pythoncom.CoUninitialize()
+
+def _wmi_query(wql):
+    """Run a WQL query and return its rows as a list"""
+    return list(_wmi().ExecQuery(wql, "WQL", _WBEM_QUERY_FLAGS))
+
+@functools.lru_cache(maxsize=1)
+def _get_system_static():
+    """Get system properties that don't change while running"""
+    uname = platform.uname()
+    return {
+        'OS': uname.system,
+        'Node Name': uname.node,
+        'Release': uname.release,
+        'Version': uname.version,
+        'Architecture': uname.machine,
+        'Processor': uname.processor or 'N/A'
+    }
 
 def get_system_info():
     """Get basic system information"""
+    return dict(_get_system_static())
+
+@functools.lru_cache(maxsize=1)
+def _get_cpu_static():
+    """Get CPU properties that don't change while running"""
+    cpu = _wmi_query(
+        "SELECT Name, Manufacturer, MaxClockSpeed, L2CacheSize, L3CacheSize "
+        "FROM Win32_Processor")[0]
     return {
-        'OS': platform.system(),
-        'Node Name': platform.node(),
-        'Release': platform.release(),
-        'Version': platform.version(),
-        'Architecture': platform.machine(),
-        'Processor': platform.processor() or 'N/A'
+        'Name': cpu.Name.strip(),
+        'Manufacturer': cpu.Manufacturer,
+        'Cores': psutil.cpu_count(logical=False),
+        'Threads': psutil.cpu_count(logical=True),
+        'Max Speed': f"{cpu.MaxClockSpeed} MHz",
+        'L2 Cache': f"{cpu.L2CacheSize} KB" if cpu.L2CacheSize else 'N/A',
+        'L3 Cache': f"{cpu.L3CacheSize} KB" if cpu.L3CacheSize else 'N/A'
+    }
+
+def _get_cpu_dynamic():
+    """Get current CPU frequency and usage"""
+    freq = psutil.cpu_freq()
+    return {
+        'Current Speed': f"{freq.current:.2f} MHz" if freq else 'N/A',
+        'Usage': f"{psutil.cpu_percent(interval=None)}%"
     }
 
 def get_cpu_info():
     """Get CPU information with better error handling"""
     try:
-        cpu = wmi_instance.Win32_Processor()[0]
-        freq = psutil.cpu_freq()
+        static = _get_cpu_static()
+        dynamic = _get_cpu_dynamic()
         return {
-            'Name': cpu.Name.strip(),
-            'Manufacturer': cpu.Manufacturer,
-            'Cores': psutil.cpu_count(logical=False),
-            'Threads': psutil.cpu_count(logical=True),
-            'Max Speed': f"{cpu.MaxClockSpeed} MHz",
-            'Current Speed': f"{freq.current:.2f} MHz" if freq else 'N/A',
-            'Usage': f"{psutil.cpu_percent(interval=1)}%",
-            'L2 Cache': f"{cpu.L2CacheSize} KB" if cpu.L2CacheSize else 'N/A',
-            'L3 Cache': f"{cpu.L3CacheSize} KB" if cpu.L3CacheSize else 'N/A'
+            'Name': static['Name'],
+            'Manufacturer': static['Manufacturer'],
+            'Cores': static['Cores'],
+            'Threads': static['Threads'],
+            'Max Speed': static['Max Speed'],
+            'Current Speed': dynamic['Current Speed'],
+            'Usage': dynamic['Usage'],
+            'L2 Cache': static['L2 Cache'],
+            'L3 Cache': static['L3 Cache']
         }
     except Exception as e:
         return {'Error': f"CPU Info Error: {str(e)}"}
@@ -46,59 +117,155 @@ def get_memory_info():
     """Get memory information with cleaner formatting"""
     mem = psutil.virtual_memory()
     return {
-        'Total': f"{mem.total / (1024**3):.2f} GB",
-        'Available': f"{mem.available / (1024**3):.2f} GB",
-        'Used': f"{mem.used / (1024**3):.2f} GB",
+        'Total': _gb(mem.total),
+        'Available': _gb(mem.available),
+        'Used': _gb(mem.used),
         'Percentage': f"{mem.percent}%",
-        'Swap Total': f"{psutil.swap_memory().total / (1024**3):.2f} GB"
+        'Swap Total': _gb(psutil.swap_memory().total)
     }
 
+@functools.lru_cache(maxsize=1)
+def _get_disk_partitions():
+    """Get the list of mounted partitions"""
+    return tuple(psutil.disk_partitions())
+
 def get_disk_info():
     """Get disk information with improved structure"""
     disk_info = {}
-    for part in psutil.disk_partitions():
+    partitions = _get_disk_partitions()
+    if not partitions:
+        return disk_info
+
+    # Each mount is stat'ed separately so one slow or sleeping drive
+    # doesn't hold up the others
+    with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+        usages = [executor.submit(psutil.disk_usage, part.mountpoint) for part in partitions]
+
+    for part, future in zip(partitions, usages):
         try:
-            usage = psutil.disk_usage(part.mountpoint)
+            usage = future.result()
             disk_info[part.device] = {
                 'Mount': part.mountpoint,
                 'Type': part.fstype,
-                'Total': f"{usage.total / (1024**3):.2f} GB",
-                'Used': f"{usage.used / (1024**3):.2f} GB",
-                'Free': f"{usage.free / (1024**3):.2f} GB",
+                'Total': _gb(usage.total),
+                'Used': _gb(usage.used),
+                'Free': _gb(usage.free),
                 'Percent': f"{usage.percent}%"
             }
         except Exception:
             continue
     return disk_info
 
+# GPU properties that don't change while running, keyed by DeviceID; filled
+# in by the first get_gpu_info() call
+_gpu_static = None
+
+def _gpu_resolution(gpu):
+    """Format the current resolution of a Win32_VideoController row"""
+    if gpu.CurrentHorizontalResolution:
+        return f"{gpu.CurrentHorizontalResolution}x{gpu.CurrentVerticalResolution}"
+    return 'N/A'
+
+def _query_gpus():
+    """Get static GPU properties and current resolutions from one query"""
+    gpus = {}
+    resolutions = {}
+    for gpu in _wmi_query(
+            "SELECT DeviceID, Name, AdapterRAM, AdapterCompatibility, DriverVersion, "
+            "CurrentHorizontalResolution, CurrentVerticalResolution "
+            "FROM Win32_VideoController"):
+        gpus[gpu.DeviceID] = {
+            'Name': gpu.Name or 'N/A',
+            'Manufacturer': gpu.AdapterCompatibility or 'N/A',
+            'VRAM': _gb(gpu.AdapterRAM or 0),
+            'Driver': gpu.DriverVersion or 'N/A'
+        }
+        resolutions[gpu.DeviceID] = _gpu_resolution(gpu)
+    return gpus, resolutions
+
+def _get_gpu_dynamic():
+    """Get the current resolution of each GPU, keyed by DeviceID"""
+    return {
+        gpu.DeviceID: _gpu_resolution(gpu)
+        for gpu in _wmi_query(
+            "SELECT DeviceID, CurrentHorizontalResolution, CurrentVerticalResolution "
+            "FROM Win32_VideoController")
+    }
+
 def get_gpu_info():
     """Get GPU information with better detail"""
+    global _gpu_static
     gpu_info = []
     try:
-        for gpu in wmi_instance.Win32_VideoController():
-            vram = gpu.AdapterRAM / (1024**3) if gpu.AdapterRAM else 0
+        # The first call reads everything in one query; later calls only
+        # need the resolutions
+        if _gpu_static is None:
+            _gpu_static, resolutions = _query_gpus()
+        else:
+            resolutions = _get_gpu_dynamic()
+        for device_id, gpu in _gpu_static.items():
             gpu_info.append({
-                'Name': gpu.Name or 'N/A',
-                'Manufacturer': gpu.AdapterCompatibility or 'N/A',
-                'VRAM': f"{vram:.2f} GB",
-                'Resolution': f"{gpu.CurrentHorizontalResolution}x{gpu.CurrentVerticalResolution}" 
-                             if gpu.CurrentHorizontalResolution else 'N/A',
-                'Driver': gpu.DriverVersion or 'N/A'
+                'Name': gpu['Name'],
+                'Manufacturer': gpu['Manufacturer'],
+                'VRAM': gpu['VRAM'],
+                'Resolution': resolutions.get(device_id, 'N/A'),
+                'Driver': gpu['Driver']
             })
     except Exception as e:
         gpu_info.append({'Error': f"GPU Info Error: {str(e)}"})
     return gpu_info
 
+class _SystemPowerStatus(ctypes.Structure):
+    """SYSTEM_POWER_STATUS as filled in by GetSystemPowerStatus"""
+    _fields_ = [
+        ('ACLineStatus', ctypes.c_ubyte),
+        ('BatteryFlag', ctypes.c_ubyte),
+        ('BatteryLifePercent', ctypes.c_ubyte),
+        ('SystemStatusFlag', ctypes.c_ubyte),
+        ('BatteryLifeTime', ctypes.c_ulong),
+        ('BatteryFullLifeTime', ctypes.c_ulong),
+    ]
+
+# Sentinel values from the SYSTEM_POWER_STATUS documentation
+_NO_SYSTEM_BATTERY = 128
+_UNKNOWN_PERCENT = 255
+_UNKNOWN_LIFETIME = 0xFFFFFFFF
+
+def _get_power_status():
+    """Get live battery state from one GetSystemPowerStatus call, or None without a battery"""
+    status = _SystemPowerStatus()
+    if not ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+        raise ctypes.WinError()
+    if status.BatteryFlag & _NO_SYSTEM_BATTERY:
+        return None
+    return status
+
+@functools.lru_cache(maxsize=1)
+def _get_battery_static():
+    """Get battery properties that don't change while running"""
+    # Full charge capacity only drifts with long-term wear, so it is cached too
+    batteries = _wmi_query(
+        "SELECT Chemistry, DesignCapacity, FullChargeCapacity, DesignVoltage "
+        "FROM Win32_Battery")
+    power = batteries[0] if batteries else None
+
+    # Convert WMI values to float/int, handling None or string cases
+    return {
+        'Chemistry': power.Chemistry if power and power.Chemistry else None,
+        'Design Capacity': float(power.DesignCapacity) if power and power.DesignCapacity else None,
+        'Full Capacity': float(power.FullChargeCapacity) if power and power.FullChargeCapacity else None,
+        'Design Voltage': float(power.DesignVoltage) if power and power.DesignVoltage else None
+    }
+
 def get_battery_health_info():
     """Get detailed battery health and charging information with type conversion"""
     try:
-        battery = psutil.sensors_battery()
-        power = wmi_instance.Win32_Battery()[0] if wmi_instance.Win32_Battery() else None
-        
-        # Convert WMI values to float/int, handling None or string cases
-        design_capacity = float(power.DesignCapacity) if power and power.DesignCapacity else None
-        full_capacity = float(power.FullChargeCapacity) if power and power.FullChargeCapacity else None
-        design_voltage = float(power.DesignVoltage) if power and power.DesignVoltage else None
+        battery = _get_power_status()
+        static = _get_battery_static()
+        chemistry = static['Chemistry']
+        design_capacity = static['Design Capacity']
+        full_capacity = static['Full Capacity']
+        design_voltage = static['Design Voltage']
         
         # Calculate health percentage safely
         health = None
@@ -106,10 +273,12 @@ def get_battery_health_info():
             health = f"{(full_capacity / design_capacity * 100):.1f}%"
         
         health_info = {
-            'Charge': f"{battery.percent}%" if battery else 'N/A',
-            'Plugged In': 'Yes' if battery and battery.power_plugged else 'No',
-            'Time Left': f"{battery.secsleft / 3600:.2f} hrs" if battery and battery.secsleft != -1 else 'N/A',
-            'Battery Type': power.Chemistry if power and power.Chemistry else 'N/A',
+            'Charge': f"{battery.BatteryLifePercent}%"
+                      if battery and battery.BatteryLifePercent != _UNKNOWN_PERCENT else 'N/A',
+            'Plugged In': 'Yes' if battery and battery.ACLineStatus == 1 else 'No',
+            'Time Left': f"{battery.BatteryLifeTime / 3600:.2f} hrs"
+                         if battery and battery.BatteryLifeTime != _UNKNOWN_LIFETIME else 'N/A',
+            'Battery Type': chemistry if chemistry else 'N/A',
             'Design Capacity': f"{design_capacity} mWh" if design_capacity else 'N/A',
             'Full Capacity': f"{full_capacity} mWh" if full_capacity else 'N/A',
             'Health': health if health else 'N/A',
@@ -119,75 +288,150 @@ def get_battery_health_info():
         health_info = {'Error': f"Battery Info Error: {str(e)}"}
     return health_info
 
+@functools.lru_cache(maxsize=1)
+def _report_styles():
+    """Build the shared report styles once"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import TableStyle
+    return {
+        'TableCell': ParagraphStyle(name='TableCell', fontSize=8, leading=10, wordWrap='CJK'),
+        'Table': TableStyle([
+            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+            ('FONTNAME', (0,0), (-1,-1), 'Helvetica'),
+            ('FONTSIZE', (0,0), (-1,-1), 8),
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+            ('BOX', (0,0), (-1,-1), 1, colors.black),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('INNERGRID', (0,0), (-1,-1), 0.25, colors.black),
+        ]),
+    }
+
+def _table_cell(value):
+    """Use a plain string cell unless the value is long enough to need wrapping"""
+    text = str(value)
+    if len(text) > 60:
+        from reportlab.platypus import Paragraph
+        return Paragraph(text, _report_styles()['TableCell'])
+    return text
+
+def _dict_to_rows(data, cell=_table_cell):
+    """Turn a dict into key/value table rows; cell is bound as a local for the loop"""
+    return [(None, [cell(key), cell(val)]) for key, val in data.items()]
+
+# Fixed row heights in points, so the table doesn't measure every cell:
+# plain cells are one line, and only wrapped Paragraph cells are measured,
+# against the width they actually get. Paddings are ReportLab's cell defaults
+_ROW_HEIGHT = 18
+_CELL_VERTICAL_PADDING = 6
+_CELL_HORIZONTAL_PADDING = 12
+
+def _row_height(kind, cells, col_widths):
+    """Get the height of a table row, measuring only its wrapped cells"""
+    # Spanned message rows give their first cell the whole table width
+    widths = [sum(col_widths)] if kind == 'message' else col_widths
+    height = _ROW_HEIGHT
+    for cell, width in zip(cells, widths):
+        if not isinstance(cell, str):
+            _, cell_height = cell.wrap(width - _CELL_HORIZONTAL_PADDING, 0)
+            height = max(height, cell_height + _CELL_VERTICAL_PADDING)
+    return height
+
 def create_pdf_report():
     """Create an enhanced PDF report"""
-    doc = SimpleDocTemplate("pc_status_report.pdf", pagesize=letter, 
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+
+    # Build in memory and write the finished file in one go
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, 
                           topMargin=0.5*inch, bottomMargin=0.5*inch,
                           leftMargin=0.5*inch, rightMargin=0.5*inch)
     styles = getSampleStyleSheet()
     
-    # Custom styles
-    styles.add(ParagraphStyle(name='TableCell', fontSize=8, leading=10, wordWrap='CJK'))
-    styles.add(ParagraphStyle(name='Footer', fontSize=8, alignment=2, textColor=colors.grey))
-    
-    story = []
-    
     # Header
-    story.append(Paragraph("PC Status Report", styles['Heading1']))
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
-                          styles['Normal']))
-    story.append(Spacer(1, 0.25*inch))
+    story = [
+        Paragraph("PC Status Report", styles['Heading1']),
+        Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
+                  styles['Normal']),
+        Spacer(1, 0.25*inch),
+    ]
 
     def add_section(title, data, nested=False):
-        """Helper to create consistent tables"""
-        story.append(Paragraph(title, styles['Heading2']))
+        """Helper to build a titled group of (row kind, cells) table rows"""
+        rows = [('section', [title, ''])]
         if not data:
-            story.append(Paragraph("No data available", styles['Normal']))
-            return
+            rows.append(('message', ["No data available", '']))
+            return rows
             
         if isinstance(data, dict) and 'Error' in data:
-            story.append(Paragraph(data['Error'], styles['Normal']))
-            return
+            rows.append(('message', [_table_cell(data['Error']), '']))
+            return rows
             
-        table_data = []
         if isinstance(data, dict):
-            for key, val in data.items():
-                table_data.append([Paragraph(str(key), styles['TableCell']),
-                                 Paragraph(str(val), styles['TableCell'])])
+            rows.extend(_dict_to_rows(data))
         elif isinstance(data, list):
             for i, item in enumerate(data):
                 if nested:
-                    story.append(Paragraph(f"{title} {i+1}", styles['Heading3']))
-                for key, val in item.items():
-                    table_data.append([Paragraph(str(key), styles['TableCell']),
-                                     Paragraph(str(val), styles['TableCell'])])
-                if nested and i < len(data) - 1:
-                    story.append(Spacer(1, 0.1*inch))
-        
-        if table_data:
-            table = Table(table_data, colWidths=[2*inch, 4*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.grey),
-                ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-                ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                ('FONTNAME', (0,0), (-1,-1), 'Helvetica'),
-                ('FONTSIZE', (0,0), (-1,-1), 8),
-                ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                ('BOX', (0,0), (-1,-1), 1, colors.black),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('INNERGRID', (0,0), (-1,-1), 0.25, colors.black),
-            ]))
-            story.append(table)
-        story.append(Spacer(1, 0.2*inch))
-
-    # Add all sections
-    add_section("System Information", get_system_info())
-    add_section("CPU Information", get_cpu_info())
-    add_section("GPU Information", get_gpu_info(), nested=True)
-    add_section("Memory Information", get_memory_info())
-    add_section("Battery Health & Charging", get_battery_health_info())
-    for disk, info in get_disk_info().items():
-        add_section(f"Disk: {disk}", info)
+                    rows.append(('subsection', [f"{title} {i+1}", '']))
+                rows.extend(_dict_to_rows(item))
+        return rows
+
+    # Collect all sections concurrently; the getters are independent and
+    # mostly wait on WMI/COM or system calls. The WMI-backed ones share a
+    # single worker thread so they need only one connection between them
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        wmi_future = executor.submit(_run_wmi_getters, get_cpu_info, get_gpu_info,
+                                     get_battery_health_info)
+        futures = {name: executor.submit(fn) for name, fn in [
+            ('system', get_system_info),
+            ('memory', get_memory_info),
+            ('disk', get_disk_info),
+        ]}
+        cpu_info, gpu_info, battery_info = wmi_future.result()
+
+        # Add all sections
+        sections = [
+            add_section("System Information", futures['system'].result()),
+            add_section("CPU Information", cpu_info),
+            add_section("GPU Information", gpu_info, nested=True),
+            add_section("Memory Information", futures['memory'].result()),
+            add_section("Battery Health & Charging", battery_info),
+        ]
+        sections.extend(add_section(f"Disk: {disk}", info)
+                        for disk, info in futures['disk'].result().items())
+
+    # All sections share one table
+    rows = list(itertools.chain.from_iterable(sections))
+    col_widths = [2*inch, 4*inch]
+    table = Table([cells for _, cells in rows], colWidths=col_widths,
+                  rowHeights=[_row_height(kind, cells, col_widths) for kind, cells in rows])
+    table.setStyle(_report_styles()['Table'])
+
+    # Row-specific styling for section, subsection and message rows
+    table_style = []
+    for row, (kind, _) in enumerate(rows):
+        if kind == 'section':
+            table_style += [
+                ('SPAN', (0,row), (-1,row)),
+                ('BACKGROUND', (0,row), (-1,row), colors.grey),
+                ('TEXTCOLOR', (0,row), (-1,row), colors.whitesmoke),
+                ('FONTNAME', (0,row), (-1,row), 'Helvetica-Bold'),
+                ('FONTSIZE', (0,row), (-1,row), 10),
+            ]
+        elif kind == 'subsection':
+            table_style += [
+                ('SPAN', (0,row), (-1,row)),
+                ('BACKGROUND', (0,row), (-1,row), colors.lightgrey),
+                ('FONTNAME', (0,row), (-1,row), 'Helvetica-Bold'),
+            ]
+        elif kind == 'message':
+            table_style.append(('SPAN', (0,row), (-1,row)))
+    table.setStyle(TableStyle(table_style))
+    story.append(table)
 
     # Custom footer with GitHub link
     def add_footer(canvas, doc):
@@ -199,6 +443,8 @@ def create_pdf_report():
         canvas.restoreState()
 
     doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+    with open("pc_status_report.pdf", "wb") as f:
+        f.write(buffer.getvalue())
     print("PDF report generated as 'pc_status_report.pdf'")
 
 if __name__ == "__main__":